@@ -13,14 +13,38 @@ Usage examples:
 """
 
 import argparse
+import functools
 import sys
 
 from askai import __version__
 
+# Long options known to the minimal parser. Any other -- token in argv (an
+# info/config flag, --help, or an argparse prefix abbreviation of one) means
+# the full parser is required; the common "askai 'prompt'" path gets by with
+# the stripped-down parser built by _create_minimal_parser().
+_MINIMAL_OPTIONS = frozenset(
+    [
+        "--provider",
+        "--model",
+        "--verbose",
+        "--dry-run",
+    ]
+)
 
+# Namespace attribute names for the info/config flags, used to check whether
+# an invocation is an info action (and therefore needs no prompt)
+_INFO_FLAGS = ("list_providers", "list_models", "config_path", "config_show", "config_reset")
+
+
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser.
 
+    The parser is memoized: construction registers a dozen actions, so
+    repeated calls (parse_args + print_help, or test suites parsing many
+    argument vectors) reuse the same instance. Callers must not add
+    arguments to the returned parser.
+
     Returns:
         Configured ArgumentParser instance
     """
@@ -129,9 +153,48 @@ configuration:
     return parser
 
 
+@functools.lru_cache(maxsize=1)
+def _create_minimal_parser() -> argparse.ArgumentParser:
+    """Create a stripped-down parser for the common query path.
+
+    Only the arguments needed for `askai [options] "prompt"` are registered;
+    the info/config flags are filled in via set_defaults so downstream code
+    sees the same namespace shape as the full parser.
+
+    Returns:
+        Minimal ArgumentParser instance
+    """
+    parser = argparse.ArgumentParser(
+        prog="askai",
+        description="Context-free, one-shot LLM queries with concise answers",
+    )
+
+    parser.add_argument("prompt", type=str, nargs="?", help="The question or prompt to ask the LLM")
+    parser.add_argument("-p", "--provider", type=str, metavar="PROVIDER")
+    parser.add_argument("-m", "--model", type=str, metavar="MODEL")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
+
+    # Match the full parser's namespace without paying for the extra actions
+    parser.set_defaults(
+        list_providers=False,
+        list_models=None,
+        config_path=False,
+        config_show=False,
+        config_reset=False,
+    )
+
+    return parser
+
+
 def parse_args(args: list[str] | None = None) -> argparse.Namespace:
     """Parse command line arguments.
 
+    Sniffs the raw argument vector first so the common paths stay cheap:
+    `--version` short-circuits without building any parser, and a plain
+    query only builds the minimal parser. The full parser is constructed
+    only for --help or when an info/config flag is present.
+
     Args:
         args: Optional list of arguments (defaults to sys.argv)
 
@@ -141,21 +204,35 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
     Raises:
         SystemExit: If arguments are invalid or help is requested
     """
-    parser = create_parser()
-    parsed = parser.parse_args(args)
+    argv = args if args is not None else sys.argv[1:]
+
+    # Fast path: --version needs no parser at all. Only honored before a
+    # "--" separator — after it, --version is prompt text, not an option.
+    try:
+        options_end = argv.index("--")
+    except ValueError:
+        options_end = len(argv)
+    if "--version" in argv[:options_end]:
+        print(f"askai {__version__}")
+        raise SystemExit(0)
+
+    # Conservative sniff: any long option the minimal parser doesn't define
+    # (including prefix abbreviations like --list-prov or --vers, which
+    # argparse accepts) routes to the full parser. "--" alone is the
+    # positional separator, not an option.
+    if "-h" in argv or any(
+        arg.startswith("--") and arg != "--" and arg.split("=", 1)[0] not in _MINIMAL_OPTIONS
+        for arg in argv
+    ):
+        parser = create_parser()
+    else:
+        parser = _create_minimal_parser()
+
+    parsed = parser.parse_args(argv)
 
     # Validation: ensure we have a prompt if not using info flags
-    if not any(
-        [
-            parsed.list_providers,
-            parsed.list_models,
-            parsed.config_path,
-            parsed.config_show,
-            parsed.config_reset,
-        ]
-    ):
-        if not parsed.prompt:
-            parser.error("the following arguments are required: prompt")
+    if not parsed.prompt and not any(getattr(parsed, flag) for flag in _INFO_FLAGS):
+        parser.error("the following arguments are required: prompt")
 
     return parsed
 
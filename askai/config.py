@@ -14,11 +14,41 @@ Default configuration structure:
 }
 """
 
+import atexit
 import json
+import mmap
 import os
+import pickle
+import weakref
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+# Canonical defaults, frozen at module scope so they can never be mutated.
+# _fresh_defaults() hands out mutable copies with the known shape — one flat
+# allocation plus one nested dict, cheaper than a generic deep copy.
+_DEFAULTS = MappingProxyType(
+    {
+        "default_provider": "claude",
+        "default_models": MappingProxyType(
+            {
+                "claude": "haiku",
+                "gemini": "gemini-flash",
+            }
+        ),
+        "max_response_words": 100,
+    }
+)
+
+
+def _fresh_defaults() -> dict[str, Any]:
+    """Return a mutable copy of the default configuration."""
+    return {
+        "default_provider": _DEFAULTS["default_provider"],
+        "default_models": dict(_DEFAULTS["default_models"]),
+        "max_response_words": _DEFAULTS["max_response_words"],
+    }
+
 
 class ConfigManager:
     """Manages askai configuration file.
@@ -27,15 +57,22 @@ class ConfigManager:
     with sensible defaults and validation.
     """
 
-    # Default configuration
-    DEFAULT_CONFIG = {
-        "default_provider": "claude",
-        "default_models": {
-            "claude": "haiku",
-            "gemini": "gemini-flash",
-        },
-        "max_response_words": 100,
-    }
+    # Default configuration (read-only view of the module-level defaults)
+    DEFAULT_CONFIG = _DEFAULTS
+
+    # Dot-notation keys compiled to tuples once, shared across instances
+    _KEY_CACHE: dict[str, tuple[str, ...]] = {}
+
+    # Live managers in creation order for the single process-wide exit
+    # flush; weak references so the hook never pins instances in memory
+    _live_instances: list["weakref.ref[ConfigManager]"] = []
+
+    # Strong references to managers with unsaved changes: a dirty manager
+    # must survive until the exit flush even if its creator drops it
+    # (main()'s manager is a closure local collected before atexit runs)
+    _dirty_refs: list["ConfigManager"] = []
+
+    _atexit_registered = False
 
     def __init__(self, config_path: Path | None = None):
         """Initialize configuration manager.
@@ -55,29 +92,124 @@ class ConfigManager:
         else:
             self.config_path = config_path
 
+        # Binary cache sits next to the human-editable source
+        self.cache_path = self.config_path.with_name(self.config_path.name + ".cache")
+
         self._config: dict[str, Any] = {}
+        self._json_cache: str | None = None
+        self._dirty = False
         self._load()
+        self._refresh_hot_keys()
+
+        # Batch mutations into one write at process exit. A single
+        # class-level hook (registered once) walks live instances in
+        # creation order, so the newest state is written last.
+        ConfigManager._live_instances.append(weakref.ref(self))
+        if not ConfigManager._atexit_registered:
+            ConfigManager._atexit_registered = True
+            atexit.register(ConfigManager._flush_all)
+
+    def _refresh_hot_keys(self) -> None:
+        """Cache values read on every CLI run as plain attributes.
+
+        Called after any operation that replaces or mutates self._config,
+        so the hot getters skip the generic dot-notation walk.
+        """
+        self._default_provider: str = self._config.get("default_provider", "claude")
+        self._max_response_words: int = self._config.get("max_response_words", 100)
 
     def _load(self) -> None:
-        """Load configuration from file or create with defaults."""
-        if self.config_path.exists():
+        """Load configuration from file or create with defaults.
+
+        config.json stays the human-editable source of truth, but a pickled
+        binary cache (config.json.cache) is kept next to it: when the cache
+        is at least as fresh as the source, startup mmaps and unpickles it
+        instead of re-parsing JSON. Stale or missing caches are rebuilt
+        after a normal JSON load.
+        """
+        try:
+            # Single stat doubles as existence check and cache-freshness key
+            self._source_mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except FileNotFoundError:
+            # No config file exists, use defaults in memory. The file is
+            # only created when a mutating operation (set/reset) saves it,
+            # so read-only invocations leave the filesystem untouched.
+            self._config = _fresh_defaults()
+            return
+
+        cached = self._load_cached()
+        if cached is not None:
+            self._config = cached
+            return
+
+        try:
+            # Binary read: json.loads on bytes skips the text-stream layer
+            with open(self.config_path, "rb") as f:
+                loaded_config = json.loads(f.read())
+
+            # Merge loaded config with defaults (in case new keys are added)
+            self._config = self._merge_with_defaults(loaded_config)
+            self._write_cache()
+
+        except (json.JSONDecodeError, OSError) as e:
+            # If config is corrupted, fall back to defaults
+            print(f"Warning: Failed to load config from {self.config_path}: {e}")
+            print("Using default configuration.")
+            self._config = _fresh_defaults()
+
+    def _load_cached(self) -> dict[str, Any] | None:
+        """Load the merged configuration from the binary cache, if fresh.
+
+        Freshness is judged against the source mtime captured by _load, so
+        this adds a single stat for the cache file.
+
+        Returns:
+            Cached configuration dict, or None if the cache is missing,
+            stale (older than config.json), or unreadable.
+        """
+        try:
+            cache_stat = os.stat(self.cache_path)
+        except OSError:
+            return None
+
+        try:
+            if cache_stat.st_mtime_ns < self._source_mtime_ns or cache_stat.st_size == 0:
+                return None
+
+            with open(self.cache_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    # Cache is written by us with 0o600 perms; trusted input
+                    loaded = pickle.loads(buf)  # noqa: S301
+
+            return loaded if isinstance(loaded, dict) else None
+
+        except Exception:
+            # The cache is best-effort: unpickling arbitrary corruption can
+            # raise nearly anything (e.g. ModuleNotFoundError for a foreign
+            # pickle), and this is the only guard on the startup path. Drop
+            # the bad cache so it can't break every subsequent run, and fall
+            # back to the JSON source.
             try:
-                with open(self.config_path, encoding="utf-8") as f:
-                    loaded_config = json.load(f)
+                self.cache_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
 
-                # Merge loaded config with defaults (in case new keys are added)
-                self._config = self._merge_with_defaults(loaded_config)
+    def _write_cache(self) -> None:
+        """Write the binary cache atomically next to config.json.
 
-            except (json.JSONDecodeError, OSError) as e:
-                # If config is corrupted, fall back to defaults
-                print(f"Warning: Failed to load config from {self.config_path}: {e}")
-                print("Using default configuration.")
-                self._config = self.DEFAULT_CONFIG.copy()
-        else:
-            # No config file exists, use defaults
-            self._config = self.DEFAULT_CONFIG.copy()
-            # Optionally create the config file
-            self._save()
+        Failures are silently ignored — the cache is an optimization and the
+        JSON source remains authoritative.
+        """
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(self._config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.chmod(tmp_path, 0o600)
+            # Atomic replace avoids torn cache files under concurrent runs
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
 
     def _merge_with_defaults(self, loaded_config: dict[str, Any]) -> dict[str, Any]:
         """Merge loaded config with defaults to ensure all keys exist.
@@ -88,7 +220,16 @@ class ConfigManager:
         Returns:
             Merged configuration with all required keys
         """
-        merged = self.DEFAULT_CONFIG.copy()
+        # Fast path: a config that already covers every default key (the
+        # normal warm case) needs no merging at all
+        if (
+            loaded_config.keys() >= self.DEFAULT_CONFIG.keys()
+            and isinstance(loaded_config.get("default_models"), dict)
+            and loaded_config["default_models"].keys() >= self.DEFAULT_CONFIG["default_models"].keys()
+        ):
+            return loaded_config
+
+        merged = _fresh_defaults()
 
         # Deep merge for nested dicts like default_models
         for key, value in loaded_config.items():
@@ -106,12 +247,14 @@ class ConfigManager:
         Uses restrictive permissions (0o600) for security.
         """
         try:
-            # Create config directory if it doesn't exist
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write config with proper formatting
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2, sort_keys=True)
+            try:
+                with open(self.config_path, "w", encoding="utf-8") as f:
+                    json.dump(self._config, f, indent=2, sort_keys=True)
+            except FileNotFoundError:
+                # Config directory missing (first save) — create and retry
+                self.config_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.config_path, "w", encoding="utf-8") as f:
+                    json.dump(self._config, f, indent=2, sort_keys=True)
 
             # Set restrictive permissions (user read/write only)
             os.chmod(self.config_path, 0o600)
@@ -129,8 +272,12 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        # Support dot notation for nested keys
-        keys = key.split(".")
+        # Support dot notation for nested keys (split compiled once per key;
+        # an explicit miss check keeps the hit path allocation-free)
+        try:
+            keys = self._KEY_CACHE[key]
+        except KeyError:
+            keys = self._KEY_CACHE[key] = tuple(key.split("."))
         value = self._config
 
         for k in keys:
@@ -147,10 +294,14 @@ class ConfigManager:
         Args:
             key: Configuration key (supports dot notation)
             value: Value to set
-            save: Whether to persist to file immediately (default: True)
+            save: Whether to persist the change (batched and written at
+                process exit; default: True)
         """
         # Support dot notation for nested keys
-        keys = key.split(".")
+        try:
+            keys = self._KEY_CACHE[key]
+        except KeyError:
+            keys = self._KEY_CACHE[key] = tuple(key.split("."))
         config = self._config
 
         # Navigate to the parent of the target key
@@ -161,9 +312,25 @@ class ConfigManager:
 
         # Set the final key
         config[keys[-1]] = value
+        self._refresh_hot_keys()
+        self._json_cache = None
 
         if save:
-            self._save()
+            # Deferred: mark dirty and let the atexit hook batch N set()
+            # calls into one disk write. Call save() for a synchronous flush.
+            self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        """Flag unsaved changes and pin this instance until the exit flush.
+
+        The live-instance list holds only weak references, so a dirty
+        manager is also kept in a strong list — otherwise a manager whose
+        creator drops it would be collected before atexit and its deferred
+        write silently lost.
+        """
+        self._dirty = True
+        if self not in ConfigManager._dirty_refs:
+            ConfigManager._dirty_refs.append(self)
 
     def get_default_provider(self) -> str:
         """Get the default provider name.
@@ -171,7 +338,7 @@ class ConfigManager:
         Returns:
             Provider name (e.g., 'claude', 'gemini')
         """
-        return self.get("default_provider", "claude")
+        return self._default_provider
 
     def get_default_model(self, provider: str) -> str | None:
         """Get the default model for a specific provider.
@@ -207,16 +374,55 @@ class ConfigManager:
         Returns:
             Maximum words for concise responses
         """
-        return self.get("max_response_words", 100)
+        return self._max_response_words
+
+    def save(self) -> None:
+        """Flush the configuration to disk synchronously.
+
+        Normally writes are batched and flushed once at process exit; use
+        this when persistence must happen immediately (e.g. before exec'ing
+        another process, where atexit hooks never run).
+        """
+        self._save()
+        self._dirty = False
+        try:
+            ConfigManager._dirty_refs.remove(self)
+        except ValueError:
+            pass
+
+    @classmethod
+    def _flush_all(cls) -> None:
+        """atexit hook: flush every live, dirty manager (oldest first).
+
+        Creation order means a newer instance's state lands on disk after
+        an older one's, so the most recent configuration wins. Dirty
+        managers are alive here even if their creators dropped them — the
+        strong _dirty_refs list pins them until this flush.
+        """
+        for ref in cls._live_instances:
+            manager = ref()
+            if manager is not None and manager._dirty:
+                manager.save()
+        cls._live_instances.clear()
+        cls._dirty_refs.clear()
 
     def reset_to_defaults(self) -> None:
         """Reset configuration to defaults and save."""
-        self._config = self.DEFAULT_CONFIG.copy()
-        self._save()
+        self._config = _fresh_defaults()
+        self._refresh_hot_keys()
+        self._json_cache = None
+        self._mark_dirty()
 
     def __str__(self) -> str:
-        """String representation of current configuration."""
-        return json.dumps(self._config, indent=2)
+        """String representation of current configuration.
+
+        The serialization is cached and invalidated on mutation, so
+        repeated display (e.g. --config-reset printing after reset) only
+        dumps once.
+        """
+        if self._json_cache is None:
+            self._json_cache = json.dumps(self._config, indent=2)
+        return self._json_cache
 
     def __repr__(self) -> str:
         """Developer-friendly representation."""
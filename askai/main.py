@@ -1,18 +1,33 @@
 """Main entry point for askai CLI tool."""
 
-import subprocess
+import functools
+import importlib
+import os
 import sys
 
 from askai.cli import parse_args, validate_args
-from askai.config import ConfigManager
-from askai.providers.claude import ClaudeProvider
 
+# Provider registry as dotted paths so provider modules are only imported
+# when actually needed ("askai --help" / "--version" never touch them).
+PROVIDERS = {
+    "claude": "askai.providers.claude:ClaudeProvider",
+    # Add more providers here as they're implemented
+    # "gemini": "askai.providers.gemini:GeminiProvider",
+}
 
-def get_provider(provider_name: str):
+
+def get_provider(provider_name: str, max_words: int = 100):
     """Get provider instance by name.
 
+    The provider module is imported lazily on first use, keeping startup
+    cheap for invocations that never execute a query. Instances are
+    cached and shared — providers are stateless after construction — so
+    repeated lookups (e.g. list_providers then the execution path) don't
+    re-allocate or re-scan PATH.
+
     Args:
         provider_name: Provider name (e.g., 'claude', 'gemini')
+        max_words: Word budget for concise responses (from config)
 
     Returns:
         Provider instance
@@ -20,24 +35,26 @@ def get_provider(provider_name: str):
     Raises:
         ValueError: If provider is not supported
     """
-    providers = {
-        "claude": ClaudeProvider,
-        # Add more providers here as they're implemented
-        # "gemini": GeminiProvider,
-    }
-
-    if provider_name not in providers:
-        available = ", ".join(providers.keys())
+    # Normalize to one positional call shape so functools.cache sees a
+    # single key per (provider, budget) regardless of how we were called
+    return _load_provider(provider_name, max_words)
+
+
+@functools.cache
+def _load_provider(provider_name: str, max_words: int):
+    if provider_name not in PROVIDERS:
+        available = ", ".join(PROVIDERS.keys())
         raise ValueError(f"Unknown provider '{provider_name}'. Available: {available}")
 
-    return providers[provider_name]()
+    module_path, class_name = PROVIDERS[provider_name].split(":")
+    provider_cls = getattr(importlib.import_module(module_path), class_name)
+    return provider_cls(max_words=max_words)
 
 
 def list_providers():
     """List all available providers."""
-    providers = ["claude"]  # Add more as implemented
     print("Available providers:")
-    for provider_name in providers:
+    for provider_name in PROVIDERS:
         provider = get_provider(provider_name)
         available = "✓" if provider.check_available() else "✗"
         print(f"  {available} {provider}")
@@ -67,8 +84,17 @@ def main():
         args = parse_args()
         validate_args(args)
 
-        # Load configuration
-        config = ConfigManager()
+        # Configuration is loaded lazily: info flags like --list-providers
+        # never touch the config file (no read, no first-run write).
+        _config = None
+
+        def get_config():
+            nonlocal _config
+            if _config is None:
+                from askai.config import ConfigManager
+
+                _config = ConfigManager()
+            return _config
 
         # Handle info/config commands
         if args.list_providers:
@@ -80,22 +106,24 @@ def main():
             return 0
 
         if args.config_path:
-            print(f"Configuration file: {config.config_path}")
+            print(f"Configuration file: {get_config().config_path}")
             return 0
 
         if args.config_show:
-            print(config)
+            sys.stdout.write(str(get_config()) + "\n")
             return 0
 
         if args.config_reset:
+            config = get_config()
             config.reset_to_defaults()
             print("Configuration reset to defaults")
-            print(config)
+            sys.stdout.write(str(config) + "\n")
             return 0
 
         # Determine provider and model
+        config = get_config()
         provider_name = args.provider or config.get_default_provider()
-        provider = get_provider(provider_name)
+        provider = get_provider(provider_name, max_words=config.get_max_response_words())
 
         # Check if provider is available
         if not provider.check_available():
@@ -122,7 +150,31 @@ def main():
         if args.dry_run:
             return 0
 
-        # Execute command
+        # Execute command. On POSIX, replace this process with the provider
+        # CLI outright: no fork/wait pair, Python's memory is released while
+        # the child runs, and SIGINT is delivered to the child alone.
+        if os.name == "posix":
+            # exec replaces the process without flushing Python's stdio,
+            # so anything printed so far (config warnings, -v output) would
+            # be lost when block-buffered into a pipe or file
+            sys.stdout.flush()
+            sys.stderr.flush()
+            try:
+                # Command comes from the provider's fixed template, not
+                # user-controlled argv splitting; deliberate process swap
+                os.execvp(command[0], command)  # noqa: S606
+            except FileNotFoundError:
+                print(
+                    f"Error: {provider_name} CLI not found. Please install it first.",
+                    file=sys.stderr,
+                )
+                return 1
+
+        # Windows has no true exec; fall back to spawn-and-wait. subprocess
+        # is one of the heaviest stdlib imports, so pull it in only here —
+        # no other code path needs it.
+        import subprocess
+
         result = subprocess.run(command, capture_output=False, text=True)
         return result.returncode
 
@@ -1,30 +1,36 @@
 """Base provider interface for LLM CLI adapters.
 
-This module defines the abstract interface that all provider adapters must implement.
-Each provider translates askai requests into the appropriate CLI command for that
-provider's tool (e.g., claude, gemini).
+This module defines the structural interface that all provider adapters must
+satisfy. Each provider translates askai requests into the appropriate CLI
+command for that provider's tool (e.g., claude, gemini).
+
+The interface is a typing.Protocol rather than an ABC: adapters don't inherit
+from it at runtime, so instantiation skips ABCMeta's abstract-method checks
+entirely. Type checkers still enforce the full method set on anything passed
+where a Provider is expected.
 """
 
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 
-class Provider(ABC):
-    """Abstract base class for LLM provider adapters.
+class Provider(Protocol):
+    """Structural interface for LLM provider adapters.
 
     Each provider adapter is responsible for:
     1. Translating prompts into provider-specific CLI commands
     2. Managing model selection (with sensible defaults for concise responses)
     3. Checking if the provider's CLI tool is installed
     4. Enforcing context-free, concise response constraints
+
+    Adapters satisfy this interface structurally — no inheritance required.
     """
 
-    @abstractmethod
     def build_command(self, prompt: str, model: str | None = None) -> list[str]:
         """Build the CLI command to execute for this provider.
 
         This method should construct a command that:
         - Is context-free (no conversation history)
-        - Requests concise responses (< 100 words)
+        - Requests concise responses (< 100 words by default)
         - Uses the specified model or default
 
         Args:
@@ -38,9 +44,8 @@ class Provider(ABC):
         Raises:
             ValueError: If the model is not supported by this provider
         """
-        pass
+        ...
 
-    @abstractmethod
     def get_default_model(self) -> str:
         """Get the default model for concise responses.
 
@@ -50,9 +55,8 @@ class Provider(ABC):
         Returns:
             Model identifier string
         """
-        pass
+        ...
 
-    @abstractmethod
     def get_available_models(self) -> list[str]:
         """Get list of available models for this provider.
 
@@ -60,9 +64,8 @@ class Provider(ABC):
             List of model identifiers that can be passed to build_command()
             Example: ['haiku', 'sonnet', 'opus'] for Claude
         """
-        pass
+        ...
 
-    @abstractmethod
     def check_available(self) -> bool:
         """Check if this provider's CLI tool is installed and available.
 
@@ -72,10 +75,9 @@ class Provider(ABC):
         Returns:
             True if provider CLI is available, False otherwise
         """
-        pass
+        ...
 
     @property
-    @abstractmethod
     def name(self) -> str:
         """Get the provider name.
 
@@ -83,7 +85,7 @@ class Provider(ABC):
             Provider name identifier (e.g., 'claude', 'gemini')
             This should be lowercase and match the CLI command name
         """
-        pass
+        ...
 
     def validate_model(self, model: str) -> bool:
         """Validate if a model is supported by this provider.
@@ -94,12 +96,4 @@ class Provider(ABC):
         Returns:
             True if model is supported, False otherwise
         """
-        return model in self.get_available_models()
-
-    def __str__(self) -> str:
-        """String representation of the provider."""
-        return f"{self.name} (default: {self.get_default_model()})"
-
-    def __repr__(self) -> str:
-        """Developer-friendly representation."""
-        return f"<Provider: {self.name}>"
+        ...
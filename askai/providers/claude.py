@@ -5,27 +5,25 @@ It translates askai requests into appropriate claude commands with model selecti
 and concise response constraints.
 """
 
+import functools
 import shutil
-
-from askai.providers.base import Provider
-
-
-class ClaudeProvider(Provider):
-    """Provider adapter for Claude Code CLI.
-
-    Supports Claude models: haiku (default), sonnet, opus
-    Command format: claude [options] "prompt"
-    """
-
-    # Model mappings - using latest Claude 4.5 series (as of October 2025)
-    MODELS = {
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+
+# Model mappings - using latest Claude 4.5 series (as of October 2025).
+# Module-level read-only proxies: shared across instances, safe from
+# accidental mutation, and one LOAD_GLOBAL instead of an attribute chain.
+_MODELS = MappingProxyType(
+    {
         "haiku": "claude-haiku-4-5-20251001",  # Haiku 4.5 - fastest, most cost-effective
         "sonnet": "claude-sonnet-4-5-20250929",  # Sonnet 4.5 - most capable
         "opus": "claude-opus-4-1-20250805",  # Opus 4.1 - complex reasoning
     }
+)
 
-    # Shorter aliases for convenience
-    MODEL_ALIASES = {
+# Shorter aliases for convenience
+_MODEL_ALIASES = MappingProxyType(
+    {
         "haiku": "haiku",
         "sonnet": "sonnet",
         "opus": "opus",
@@ -39,6 +37,74 @@ class ClaudeProvider(Provider):
         "opus-4-1": "opus",
         "4-1-opus": "opus",
     }
+)
+
+
+@functools.cache
+def _which(cmd: str) -> str | None:
+    """Locate a command on PATH, cached for the process lifetime.
+
+    shutil.which walks every $PATH entry with an access check; availability
+    doesn't change within a single askai run, so do it at most once per
+    command.
+    """
+    return shutil.which(cmd)
+
+
+def _build_resolved(models: Mapping[str, str], aliases: Mapping[str, str]) -> dict[str, str]:
+    """Flatten model tables into a single alias -> full-model-id lookup.
+
+    Includes every alias, every canonical short name, and every full model
+    id (mapped to itself), so resolution is one dict access at call time.
+    """
+    resolved = {alias: models[canonical] for alias, canonical in aliases.items()}
+    for short, full_id in models.items():
+        resolved[short] = full_id
+        resolved[full_id] = full_id
+    return resolved
+
+
+# Flat lookup computed once at import time: any accepted spelling
+# (alias, short name, or full id) -> full model identifier
+_RESOLVED = MappingProxyType(_build_resolved(_MODELS, _MODEL_ALIASES))
+
+
+class ClaudeProvider:
+    """Provider adapter for Claude Code CLI.
+
+    Satisfies the Provider protocol structurally (see askai.providers.base)
+    without inheriting from it, so instantiation is a plain object creation
+    with no ABC machinery.
+
+    Supports Claude models: haiku (default), sonnet, opus
+    Command format: claude [options] "prompt"
+    """
+
+    # Kept as class attributes for the public API; both are read-only
+    # views of the module-level tables
+    MODELS = _MODELS
+    MODEL_ALIASES = _MODEL_ALIASES
+
+    def __init__(self, max_words: int = 100):
+        """Initialize the provider.
+
+        Args:
+            max_words: Word budget for concise responses, normally taken
+                from ConfigManager.get_max_response_words()
+        """
+        # Built once so build_command only concatenates per call
+        self._prefix = f"Answer concisely in under {max_words} words: "
+
+        # Specialized per-spelling builders: each closure captures the full
+        # model id and prefix, so build_command is one dict lookup, one
+        # concat, and one list literal per call.
+        prefix = self._prefix
+        self._builders: dict[str, Callable[[str], list[str]]] = {
+            spelling: (
+                lambda prompt, mid=model_id: ["claude", "-p", prefix + prompt, "--model", mid]
+            )
+            for spelling, model_id in _RESOLVED.items()
+        }
 
     @property
     def name(self) -> str:
@@ -59,7 +125,7 @@ class ClaudeProvider(Provider):
         Returns:
             List of model identifiers (short names)
         """
-        return list(self.MODELS.keys())
+        return list(_MODELS)
 
     def check_available(self) -> bool:
         """Check if Claude Code CLI is installed and available.
@@ -67,37 +133,7 @@ class ClaudeProvider(Provider):
         Returns:
             True if 'claude' command is found in PATH
         """
-        return shutil.which("claude") is not None
-
-    def _resolve_model(self, model: str | None) -> str:
-        """Resolve model alias to canonical model identifier.
-
-        Args:
-            model: Model name or alias (e.g., 'haiku', 'sonnet-4-5')
-
-        Returns:
-            Full model identifier for Claude API
-
-        Raises:
-            ValueError: If model is not recognized
-        """
-        if model is None:
-            model = self.get_default_model()
-
-        # Normalize to lowercase
-        model = model.lower()
-
-        # Try alias resolution first
-        if model in self.MODEL_ALIASES:
-            model = self.MODEL_ALIASES[model]
-
-        # Check if it's a valid model
-        if model not in self.MODELS:
-            raise ValueError(
-                f"Unknown model '{model}'. Available: {', '.join(self.get_available_models())}"
-            )
-
-        return self.MODELS[model]
+        return _which("claude") is not None
 
     def build_command(self, prompt: str, model: str | None = None) -> list[str]:
         """Build the Claude CLI command.
@@ -120,25 +156,39 @@ class ClaudeProvider(Provider):
         Example:
             >>> provider = ClaudeProvider()
             >>> provider.build_command("What is Python?", "haiku")
-            ['claude', '--model', 'claude-haiku-4-5-20251001',
-             'Answer concisely in under 100 words: What is Python?']
+            ['claude', '-p', 'Answer concisely in under 100 words: What is Python?',
+             '--model', 'claude-haiku-4-5-20251001']
         """
-        model_id = self._resolve_model(model)
+        if model is None:
+            model = self.get_default_model()
 
-        # Prepend instruction for concise responses to the prompt
-        concise_prompt = f"Answer concisely in under 100 words: {prompt}"
+        # The -p/--print flag (baked into each builder) keeps this a
+        # one-shot, non-interactive command
+        try:
+            builder = self._builders[model.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Unknown model '{model}'. Available: {', '.join(self.get_available_models())}"
+            ) from None
+
+        return builder(prompt)
 
-        # Build command for one-shot, non-interactive mode
-        # Use -p/--print flag to get response without entering interactive UI
-        command = [
-            "claude",
-            "-p", concise_prompt,  # One-shot mode (print and exit)
-            "--model", model_id,
-        ]
+    def validate_model(self, model: str) -> bool:
+        """Validate if a model is supported by this provider.
 
-        return command
+        Args:
+            model: Model identifier to validate
+
+        Returns:
+            True if model is supported, False otherwise
+        """
+        return model in self.get_available_models()
 
     def __str__(self) -> str:
         """String representation showing available models."""
         models = ", ".join(self.get_available_models())
         return f"claude (default: {self.get_default_model()}, available: {models})"
+
+    def __repr__(self) -> str:
+        """Developer-friendly representation."""
+        return f"<Provider: {self.name}>"